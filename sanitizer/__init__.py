@@ -1,2 +1,3 @@
 from sanitizer.exceptions import ValidationError
 from sanitizer.schema import Schema
+from sanitizer.validators import regex, str_ops
@@ -12,8 +12,13 @@ class ValidationError(ExceptionGroup):
 class FieldValidationError(Exception):
     """
     Исключение, описывающее ошибку валидации данных для конкретного поля схемы.
+
+    Атрибуты хранятся в __slots__: ошибки создаются по одной на каждое невалидное значение,
+    и без слотов каждый экземпляр дополнительно аллоцировал бы собственный __dict__.
     """
 
+    __slots__ = ("field", "location", "message")
+
     def __init__(self, *, field: str, message: str, location: list[str | int]) -> None:
         self.field: str = field
         self.message: str = message
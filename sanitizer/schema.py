@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from contextlib import suppress
+from functools import partial
 from typing import TYPE_CHECKING, Annotated, Any, get_args, get_origin, get_type_hints
 
 from sanitizer.exceptions import FieldValidationError, ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from typing import Self
 
 
@@ -14,6 +17,74 @@ type FieldValue = Any
 type FieldsMapping = dict[FieldName, FieldValue]
 type TypeHintsMapping = dict[FieldName, Any]
 
+type Location = list[FieldName | int]
+type Resolver = Callable[[FieldName, FieldValue, Location, list[FieldValidationError]], FieldValue | ellipsis]
+type FieldPlan = dict[FieldName, Resolver]
+type Validator = Callable[[FieldsMapping, FieldsMapping, list[FieldValidationError], Location], None]
+
+# Маркер отсутствующего во входных данных поля
+_MISSING: Any = object()
+
+_MISSING_FIELD_MESSAGE = "Обязательное поле не передано"
+_DISALLOWED_FIELD_MESSAGE = "Поле не предусмотрено схемой"
+
+# Подклассы, которые не принимаются для скалярного типа: bool — подкласс int,
+# но True/False в поле int почти всегда означают ошибку во входных данных
+_EXCLUDED_SUBCLASSES: dict[type, type] = {int: bool}
+
+
+def _check_keywords(fields: FieldsMapping) -> None:
+    """
+    Функция для проверки ключей входных данных так же, как их проверяет интерпретатор
+    при вызове конструктора схемы Schema.__init__(self, **fields).
+
+    Нужна там, где вместо конструктора функция валидации схемы вызывается напрямую
+    (вложенные схемы, validate с max_errors): входные данные, которые конструктор отклонил бы
+    с TypeError, должны отклоняться так же, а не превращаться в ошибки валидации.
+
+    :raise TypeError: Ключ не является строкой или совпадает с именем параметра self.
+    """
+
+    for field in fields:
+        if not isinstance(field, str):
+            raise TypeError("keywords must be strings")
+
+    if "self" in fields:
+        raise TypeError(f"{Schema.__init__.__qualname__}() got multiple values for argument 'self'")
+
+
+class _ErrorLimitReachedError(Exception):
+    """
+    Служебное исключение для прерывания валидации при достижении лимита ошибок.
+    """
+
+
+class _LimitedErrorList(list[FieldValidationError]):
+    """
+    Список ошибок валидации с ограничением размера.
+
+    Резолверы и функция валидации схемы добавляют ошибки только через append и extend,
+    поэтому проверка лимита выполняется только здесь: после добавления ошибки, на которой
+    достигнут лимит, валидация прерывается исключением _ErrorLimitReachedError.
+    """
+
+    __slots__ = ("max_errors",)
+
+    def __init__(self, max_errors: int) -> None:
+        super().__init__()
+        self.max_errors = max_errors
+
+    def append(self, error: FieldValidationError) -> None:
+        super().append(error)
+        if len(self) >= self.max_errors:
+            raise _ErrorLimitReachedError
+
+    def extend(self, errors: Iterable[FieldValidationError]) -> None:
+        super().extend(errors)
+        if len(self) >= self.max_errors:
+            del self[self.max_errors :]
+            raise _ErrorLimitReachedError
+
 
 class Schema:
     """
@@ -25,159 +96,394 @@ class Schema:
         """
         Базовый конструктор схемы.
 
+        Функция валидации схемы записывает нормализованные значения напрямую в __dict__ экземпляра,
+        без промежуточного словаря, поэтому дескрипторы и переопределенный __setattr__
+        при инициализации не вызываются.
+
         :raise ValidationError: Ошибка валидации схемы.
         """
 
-        values, errors = type(self)._run_validation(fields)
-
-        for k, v in values.items():
-            setattr(self, k, v)
+        errors: list[FieldValidationError] = []
+        type(self)._get_validator()(fields, self.__dict__, errors, [])
 
         if errors:
             raise ValidationError(f"{type(self).__name__}: validation failed", errors)
 
     @classmethod
-    def validate(cls, fields: FieldsMapping) -> Self:
+    def validate(cls, fields: FieldsMapping, *, max_errors: int | None = None) -> Self:
         """
         Метод для валидации входных данных. Возвращает готовый экземпляр схемы.
 
+        По умолчанию собираются все ошибки валидации. Если передан max_errors, валидация
+        прерывается, как только накоплено max_errors ошибок, и ValidationError содержит
+        только их. Для схем с переопределенным __init__ ранняя остановка невозможна:
+        валидация выполняется полностью, а список ошибок обрезается до max_errors.
+
         :raise ValidationError: Ошибка валидации схемы.
+        :raise TypeError: max_errors не является int (bool не допускается).
+        :raise ValueError: max_errors меньше 1.
         """
 
-        return cls(**fields)
+        if max_errors is None:
+            return cls(**fields)
+
+        if not isinstance(max_errors, int) or isinstance(max_errors, bool):
+            raise TypeError(f"max_errors должен быть int, передано {type(max_errors).__name__}")
+
+        if max_errors < 1:
+            raise ValueError("max_errors должен быть не меньше 1")
+
+        if cls.__init__ is not Schema.__init__:
+            try:
+                return cls(**fields)
+            except ValidationError as exc:
+                raise ValidationError(exc.message, exc.exceptions[:max_errors]) from None
+
+        return cls._validate_with_limit(max_errors, **fields)
 
     @classmethod
-    def _run_validation(cls, fields: FieldsMapping) -> tuple[FieldsMapping, list[FieldValidationError]]:
+    def _validate_with_limit(cls, max_errors: int, /, **fields: FieldValue) -> Self:
         """
-        Базовый метод для валидации и нормализации переданной сущности по заданным type hints в схеме.
+        Метод для валидации входных данных с остановкой на max_errors ошибках.
+
+        Данные принимаются как именованные аргументы, так же как в конструкторе схемы,
+        поэтому входные данные проверяются интерпретатором одинаково с validate без лимита
+        (например, ключи, не являющиеся строками, дают TypeError).
 
-        :returns: Словарь нормализованных данных, список ошибок
+        :returns: Экземпляр схемы
+        :raise ValidationError: Ошибка валидации схемы.
         """
 
-        errors: list[FieldValidationError] = []
-        type_hints = get_type_hints(cls, include_extras=True)
+        instance = cls.__new__(cls)
+        errors = _LimitedErrorList(max_errors)
+        with suppress(_ErrorLimitReachedError):
+            cls._get_validator()(fields, instance.__dict__, errors, [])
 
-        errors += cls._validate_missing_fields(fields, type_hints)
-        errors += cls._validate_disallowed_fields(fields, type_hints)
+        if errors:
+            raise ValidationError(f"{cls.__name__}: validation failed", errors)
 
-        validated_fields, fields_errors = cls._validate_allowed_fields(fields, type_hints)
-        errors += fields_errors
+        return instance
 
-        return validated_fields, errors
+    @classmethod
+    def from_validated(cls, fields: FieldsMapping) -> Self:
+        """
+        Метод для создания экземпляра схемы из уже провалидированных и нормализованных данных.
+        Проверка типов не выполняется, поэтому данные должны быть получены из доверенного источника
+        (например, из полей другого экземпляра этой же схемы).
 
-    @staticmethod
-    def _validate_missing_fields(fields: FieldsMapping, type_hints: TypeHintsMapping) -> list[FieldValidationError]:
+        :returns: Экземпляр схемы
         """
-        Метод для валидации пропущенных полей схемы.
 
-        :returns: Список ошибок валидации
+        instance = cls.__new__(cls)
+        instance.__dict__.update(fields)
+        return instance
+
+    @classmethod
+    def _get_type_hints(cls) -> TypeHintsMapping:
         """
+        Метод для получения type hints схемы.
 
-        errors: list[FieldValidationError] = []
-        missing_fields: set[FieldName] = type_hints.keys() - fields.keys()
+        Аннотации схемы статичны, поэтому get_type_hints вызывается один раз на класс,
+        а результат кэшируется в атрибуте самого класса (не наследуется подклассами).
+        Вычисление отложено до первой валидации, чтобы поддерживать forward references.
 
-        for field in missing_fields:
-            errors.append(
-                FieldValidationError(
-                    field=field,
-                    message="Обязательное поле не передано",
-                    location=[field],
-                )
-            )
-        return errors
+        :returns: Словарь type hints схемы
+        """
 
-    @staticmethod
-    def _validate_disallowed_fields(fields: FieldsMapping, type_hints: TypeHintsMapping) -> list[FieldValidationError]:
+        type_hints: TypeHintsMapping | None = cls.__dict__.get("_type_hints")
+
+        if type_hints is None:
+            type_hints = get_type_hints(cls, include_extras=True)
+            cls._type_hints = type_hints
+
+        return type_hints
+
+    @classmethod
+    def _get_field_plan(cls) -> FieldPlan:
         """
-        Метод для валидации неразрешенных полей схемы.
+        Метод для получения плана валидации схемы: для каждого поля заранее подобран резолвер
+        с уже привязанными аргументами (ожидаемый тип, резолверы элементов, валидаторы).
+
+        План строится один раз на класс по type hints и кэшируется так же, как и сами type hints.
 
-        :returns: Список ошибок валидации
+        :returns: Словарь резолверов полей схемы
         """
 
-        errors: list[FieldValidationError] = []
-        disallowed_fields: set[FieldName] = fields.keys() - type_hints.keys()
+        field_plan: FieldPlan | None = cls.__dict__.get("_field_plan")
 
-        for field in disallowed_fields:
-            errors.append(
-                FieldValidationError(
-                    field=field,
-                    message="Поле не предусмотрено схемой",
-                    location=[field],
-                )
-            )
-        return errors
+        if field_plan is None:
+            field_plan = {field: cls._build_resolver(hint) for field, hint in cls._get_type_hints().items()}
+            cls._field_plan = field_plan
+
+        return field_plan
 
     @classmethod
-    def _validate_allowed_fields(
-        cls, fields: FieldsMapping, type_hints: TypeHintsMapping
-    ) -> tuple[FieldsMapping, list[FieldValidationError]]:
+    def _get_validator(cls) -> Validator:
         """
-        Метод для валидации разрешенных полей схемы.
+        Метод для получения сгенерированной функции валидации схемы.
+
+        Функция генерируется один раз на класс по плану полей и кэшируется так же, как и сам план.
 
-        :returns: Нормализованные значения полей, список ошибок валидации
+        :returns: Функция валидации схемы
         """
 
-        errors: list[FieldValidationError] = []
-        allowed_fields: set[FieldName] = type_hints.keys() & fields.keys()
-        validated_fields: FieldsMapping = {}
+        validator: Validator | None = cls.__dict__.get("_validator")
+
+        if validator is None:
+            validator = cls._compile_validator(cls._get_field_plan())
+            cls._validator = validator
+
+        return validator
+
+    @classmethod
+    def _compile_validator(cls, field_plan: FieldPlan) -> Validator:
+        """
+        Метод для генерации функции валидации схемы по плану полей.
+
+        Вместо обхода плана в цикле генерируется исходный код функции с отдельной веткой на каждое поле:
+            - проверка наличия поля во входных данных;
+            - для скалярных типов — isinstance и формирование ошибки прямо в теле функции, без вызова резолвера;
+            - для Annotated над скалярным типом — isinstance и последовательные вызовы валидаторов
+              прямо в теле функции (валидаторы доступны в пространстве имен функции как
+              validator_<номер поля>_<номер валидатора>, имя валидатора встраивается только в текст ошибки);
+            - для Any — значение записывается как есть, без вызова резолвера;
+            - для остальных типов — вызов заранее подобранного резолвера поля.
+        В начале функции, если среди ключей входных данных есть не поля схемы, ключи проверяются
+        так же, как при вызове конструктора (см. _check_keywords).
+        В конце функции входные данные проверяются на поля, не предусмотренные схемой. Каждое переданное поле
+        схемы соответствует ровно одному ключу входных данных, поэтому лишние ключи есть тогда и только тогда,
+        когда len(fields) + <число пропущенных полей> != <число полей схемы>. Поэлементный проход по входным
+        данным выполняется только в этом случае, для формирования ошибок.
+
+        :returns: Функция, принимающая входные данные, словарь для нормализованных значений
+            (например, __dict__ экземпляра), общий список ошибок и location самой схемы
+            (пустой для корневой схемы, непустой для вложенной)
+        """
+
+        namespace: dict[str, Any] = {
+            "_MISSING": _MISSING,
+            "FieldValidationError": FieldValidationError,
+            "field_names": frozenset(field_plan),
+            "check_keywords": _check_keywords,
+        }
+        lines: list[str] = [
+            "def validate(fields, values, errors, location):",
+            "    append_error = errors.append",
+            "    missing_count = 0",
+            "    if not field_names.issuperset(fields):",
+            "        check_keywords(fields)",
+        ]
+
+        for index, (field, resolver) in enumerate(field_plan.items()):
+            namespace[f"resolve_{index}"] = resolver
+            lines += [
+                f"    value = fields.get({field!r}, _MISSING)",
+                "    if value is _MISSING:",
+                "        missing_count += 1",
+                "        append_error(",
+                f"            FieldValidationError(field={field!r}, message={_MISSING_FIELD_MESSAGE!r}, location=[*location, {field!r}])",
+                "        )",
+            ]
+
+            # Отдельная проверка type(value) is T перед isinstance не нужна: PyObject_IsInstance
+            # сам начинает с точного сравнения типа, а лишний вызов type() только замедляет проверку.
+            if cls._is_resolver(resolver, Schema._resolve_scalar_type):
+                lines += [
+                    f"    elif {cls._render_type_check(namespace, index, resolver)}:",
+                    f"        values[{field!r}] = value",
+                    "    else:",
+                    *cls._render_type_error(field, resolver.keywords["message_prefix"]),
+                ]
+            elif cls._is_resolver(resolver, Schema._resolve_validators) and cls._is_resolver(
+                base_resolver := resolver.keywords["base_resolver"], Schema._resolve_scalar_type
+            ):
+                lines += [
+                    f"    elif not ({cls._render_type_check(namespace, index, base_resolver)}):",
+                    *cls._render_type_error(field, base_resolver.keywords["message_prefix"]),
+                    "    else:",
+                    "        errors_count = len(errors)",
+                ]
+                for validator_index, (validator, message_prefix) in enumerate(resolver.keywords["validators"]):
+                    namespace[f"validator_{index}_{validator_index}"] = validator
+                    lines += [
+                        "        try:",
+                        f"            value = validator_{index}_{validator_index}(value)",
+                        "        except Exception as exc:",
+                        "            append_error(",
+                        "                FieldValidationError(",
+                        f"                    field={field!r},",
+                        f"                    message={message_prefix!r} + str(exc),",
+                        f"                    location=[*location, {field!r}],",
+                        "                )",
+                        "            )",
+                    ]
+                lines += [
+                    f"        values[{field!r}] = value if len(errors) == errors_count else ...",
+                ]
+            elif cls._is_resolver(resolver, Schema._resolve_any_type):
+                lines += [
+                    "    else:",
+                    f"        values[{field!r}] = value",
+                ]
+            else:
+                lines += [
+                    "    else:",
+                    f"        location.append({field!r})",
+                    f"        values[{field!r}] = resolve_{index}({field!r}, value, location, errors)",
+                    "        location.pop()",
+                ]
+
+        lines += [
+            f"    if len(fields) + missing_count != {len(field_plan)}:",
+            "        for field in fields:",
+            "            if field not in field_names:",
+            "                append_error(",
+            f"                    FieldValidationError(field=field, message={_DISALLOWED_FIELD_MESSAGE!r}, location=[*location, field])",
+            "                )",
+        ]
+
+        code = compile("\n".join(lines), f"<schema {cls.__qualname__}>", "exec")
+        exec(code, namespace)  # noqa: S102
+        return namespace["validate"]
+
+    @staticmethod
+    def _is_resolver(resolver: Resolver, method: Callable[..., Any]) -> bool:
+        """
+        Метод для проверки, что резолвер из плана построен на основе указанного метода-резолвера Schema.
+        Если подкласс переопределил этот метод, проверка не проходит: оптимизации, повторяющие
+        логику резолвера (встраивание в функцию валидации, быстрые пути для списков), применяются
+        только к реализации из Schema, а переопределенный резолвер всегда вызывается.
 
-        for field in allowed_fields:
-            value = fields[field]
-            expected_type = type_hints[field]
+        :returns: Результат проверки
+        """
+
+        func = resolver.func if isinstance(resolver, partial) else resolver
+        return getattr(func, "__func__", None) is getattr(method, "__func__", method)
+
+    @staticmethod
+    def _render_type_check(namespace: dict[str, Any], index: int, scalar_resolver: Resolver) -> str:
+        """
+        Метод для генерации условия проверки скалярного типа поля (аналог проверки в _resolve_scalar_type).
+        Нужные условию типы добавляются в пространство имен генерируемой функции.
+
+        :returns: Исходный код условия
+        """
+
+        namespace[f"type_{index}"] = scalar_resolver.keywords["expected_type"]
+        if (excluded_type := scalar_resolver.keywords["excluded_type"]) is None:
+            return f"isinstance(value, type_{index})"
+
+        namespace[f"excluded_type_{index}"] = excluded_type
+        return f"isinstance(value, type_{index}) and type(value) is not excluded_type_{index}"
 
-            validated_value, validation_errors = cls._check_field_type(field, value, expected_type)
+    @staticmethod
+    def _render_type_error(field: FieldName, message_prefix: str) -> list[str]:
+        """
+        Метод для генерации исходного кода ветки с ошибкой несоответствия скалярного типа поля.
 
-            validated_fields[field] = validated_value
-            errors += validation_errors
+        :returns: Строки исходного кода
+        """
 
-        return validated_fields, errors
+        return [
+            f"        values[{field!r}] = ...",
+            "        append_error(",
+            "            FieldValidationError(",
+            f"                field={field!r},",
+            f"                message={message_prefix!r} + type(value).__name__,",
+            f"                location=[*location, {field!r}],",
+            "            )",
+            "        )",
+        ]
 
     @classmethod
-    def _check_field_type(
-        cls, field: FieldName, value: FieldValue, expected_type: Any
-    ) -> tuple[FieldValue | ellipsis, list[FieldValidationError]]:
+    def _build_resolver(cls, expected_type: Any) -> Resolver:
         """
-        Метод для проверки на соответствие типов и нормализации конкретного типов полей:
+        Метод для подбора резолвера под конкретный тип поля:
             - Any
             - Скалярные значения: (int, float, str, bool, и т.д.)
             - Schema
             - Списки
 
-        Если поле провалидировано с ошибкой будет проставлен ellipsis (...)
+        Разбор аннотации выполняется один раз при построении плана схемы,
+        резолверы вложенных типов (элементы списков, базовый тип Annotated) подбираются рекурсивно.
+        Неизменяемые части сообщений об ошибках также формируются здесь и привязываются к резолверу.
 
-        :returns: Нормализованное значение для поля, список ошибок валидации
+        :returns: Резолвер, принимающий имя поля, значение, location значения и общий список ошибок.
+            location — общий изменяемый путь до значения: при спуске к вложенным значениям резолверы
+            дописывают в него сегмент и удаляют его после проверки, а в ошибки попадает копия пути.
         """
 
         # Проверка на Any
         if expected_type is Any:
-            return cls._resolve_any_type(field, value, expected_type)
+            return cls._resolve_any_type
+
+        origin, args = get_origin(expected_type), get_args(expected_type)
 
         # Проверка кастомных валидаторов
-        if get_origin(expected_type) is Annotated:
-            return cls._resolve_validators(field, value, expected_type)
+        if origin is Annotated:
+            base_type, *validators = args
+            return partial(
+                cls._resolve_validators,
+                base_resolver=cls._build_resolver(base_type),
+                validators=tuple(
+                    (validator, f"Ошибка валидатора {cls._get_validator_name(validator)}: ") for validator in validators
+                ),
+            )
 
         # Проверка на списки
-        if get_origin(expected_type) is list:
-            return cls._resolve_list_type(field, value, expected_type)
+        if origin is list:
+            item_type = args[0]
+            item_resolver = cls._build_resolver(item_type)
+            item_is_scalar = cls._is_resolver(item_resolver, Schema._resolve_scalar_type)
+            item_is_schema = cls._is_resolver(item_resolver, Schema._resolve_schema_type)
+            return partial(
+                cls._resolve_list_type,
+                item_resolver=item_resolver,
+                item_types=frozenset((item_type,)) if item_is_scalar or item_is_schema else None,
+                item_schema=item_type if item_is_schema and item_resolver.keywords["validate_directly"] else None,
+                message_prefix=f"Ожидался список {expected_type!r}, получено ",
+            )
 
         # Проверка на неподдерживаемые сложные типы
-        if get_origin(expected_type) is not None or not isinstance(expected_type, type):
-            return cls._resolve_unsupported_type(field, value, expected_type)
+        if origin is not None or not isinstance(expected_type, type):
+            return partial(
+                cls._resolve_unsupported_type,
+                message=f"Переданный тип не поддерживается: {expected_type!r}",
+            )
 
         # Проверка вложенных схем
         if issubclass(expected_type, Schema):
-            return cls._resolve_schema_type(field, value, expected_type)
+            return partial(
+                cls._resolve_schema_type,
+                expected_type=expected_type,
+                validate_directly=expected_type.__init__ is Schema.__init__,
+                message_prefix=f"Ожидались dict или {expected_type.__name__}; передано ",
+            )
 
         # Проверка обычные типов
-        if not isinstance(value, expected_type):
-            return cls._resolve_scalar_type(field, value, expected_type)
+        return partial(
+            cls._resolve_scalar_type,
+            expected_type=expected_type,
+            excluded_type=_EXCLUDED_SUBCLASSES.get(expected_type),
+            message_prefix=f"Ожидалось {expected_type.__name__}, передано ",
+        )
 
-        return value, []
+    @staticmethod
+    def _get_validator_name(validator: Callable[[FieldValue], FieldValue]) -> str:
+        """
+        Метод для получения имени валидатора для сообщений об ошибках.
+        У функций используется __name__, у вызываемых объектов без него (functools.partial,
+        экземпляры классов с __call__) — имя их класса.
+
+        :returns: Имя валидатора
+        """
+
+        return getattr(validator, "__name__", None) or type(validator).__name__
 
     @classmethod
     def _resolve_any_type(
-        cls, field: FieldName, value: FieldValue, expected_type: Any
-    ) -> tuple[FieldValue | ellipsis, list[FieldValidationError]]:
+        cls, field: FieldName, value: FieldValue, location: Location, errors: list[FieldValidationError]
+    ) -> FieldValue | ellipsis:
         """
         Резолвер для типа Any.
 
@@ -186,176 +492,254 @@ class Schema:
             - Значение возвращается в исходном виде.
             - Ошибки валидации не формируются никогда.
 
-        :returns: Нормализованное значение для поля, список ошибок валидации
+        Все резолверы добавляют ошибки валидации в переданный общий список errors.
+
+        :returns: Нормализованное значение для поля
         """
 
-        return value, []
+        return value
 
     @classmethod
     def _resolve_list_type(
-        cls, field: FieldName, value: FieldValue, expected_type: Any
-    ) -> tuple[FieldValue | ellipsis, list[FieldValidationError]]:
+        cls,
+        field: FieldName,
+        value: FieldValue,
+        location: Location,
+        errors: list[FieldValidationError],
+        *,
+        item_resolver: Resolver,
+        item_types: frozenset[type] | None,
+        item_schema: type[Schema] | None,
+        message_prefix: str,
+    ) -> FieldValue | ellipsis:
         """
         Резолвер для списков.
 
         Логика:
             - Проверяет, что значение является list.
-            - Извлекает ожидаемый тип элементов из аннотации list[T].
-            - Каждый элемент списка рекурсивно валидируется через _check_field_type.
-            - При ошибках у дочерних элементов их location дополняется индексом списка.
-
-        :returns: Нормализованное значение для поля, список ошибок валидации
+            - Каждый элемент списка валидируется заранее подобранным резолвером item_resolver
+              для типа элементов из аннотации list[T].
+            - Элементы валидируются с location, дополненным индексом элемента в списке
+              (последний сегмент пути перезаписывается на каждой итерации).
+            - Если тип элементов — обычный класс (item_types), сначала на уровне C собирается
+              множество точных типов элементов (set + map(type)). Если все элементы ровно нужного
+              типа, возвращается копия списка без поэлементного вызова резолвера; подклассы
+              и несовпадения проверяются уже поэлементно.
+            - Если элементы — схемы без переопределенного __init__ (item_schema), функция валидации
+              схемы получается один раз на весь список, и элементы-dict валидируются ею напрямую
+              в цикле, без вызова резолвера вложенной схемы на каждый элемент.
+            - Элементы с ошибками заменяются на ellipsis.
+
+        :returns: Нормализованное значение для поля
         """
 
-        item_type = get_args(expected_type)[0]
-
         if not isinstance(value, list):
-            return ..., [
+            errors.append(
                 FieldValidationError(
                     field=field,
-                    message=f"Ожидался список {expected_type!r}, получено {type(value).__name__}",
-                    location=[field],
+                    message=message_prefix + type(value).__name__,
+                    location=[*location],
                 )
-            ]
+            )
+            return ...
+
+        if item_types is not None and {*map(type, value)} <= item_types:
+            return value.copy()
 
         validated_list: list[Any] = []
-        errors: list[FieldValidationError] = []
+        append_item = validated_list.append
+        errors_count = len(errors)
+        location.append(0)
+
+        if item_schema is not None:
+            validate_item = item_schema._get_validator()
+            new_item = item_schema.__new__
 
         for index, item in enumerate(value):
-            validated_item, item_errors = cls._check_field_type(field, item, item_type)
-            if item_errors:
-                for error in item_errors:
-                    error.location.insert(1, index)
-                errors.extend(item_errors)
-                validated_list.append(...)
+            location[-1] = index
+            if item_schema is not None and type(item) is dict:
+                validated_item = new_item(item_schema)
+                validate_item(item, validated_item.__dict__, errors, location)
+            else:
+                validated_item = item_resolver(field, item, location, errors)
+            if len(errors) != errors_count:
+                errors_count = len(errors)
+                append_item(...)
             else:
-                validated_list.append(validated_item)
+                append_item(validated_item)
 
-        return validated_list, errors
+        location.pop()
+        return validated_list
 
     @classmethod
     def _resolve_unsupported_type(
-        cls, field: FieldName, value: FieldValue, expected_type: Any
-    ) -> tuple[FieldValue | ellipsis, list[FieldValidationError]]:
+        cls,
+        field: FieldName,
+        value: FieldValue,
+        location: Location,
+        errors: list[FieldValidationError],
+        *,
+        message: str,
+    ) -> FieldValue | ellipsis:
         """
         Резолвер-заглушка для неподдержанных типов.
 
         Логика:
             - Вызывается, если аннотация поля относится к generic или конструкциям typing,
-              которые ещё не реализованы (например, Union, Dict, Tuple, Annotated и т.п.).
+              которые ещё не реализованы (например, Union, Dict, Tuple и т.п.).
             - Всегда возвращает ellipsis вместо значения.
             - Формирует единственную ошибку FieldValidationError с указанием,
               что данный тип не поддерживается.
 
-        :returns: Нормализованное значение для поля, список ошибок валидации
+        :returns: Нормализованное значение для поля
         """
 
-        return ..., [
+        errors.append(
             FieldValidationError(
                 field=field,
-                message=f"Переданный тип не поддерживается: {expected_type!r}",
-                location=[field],
+                message=message,
+                location=[*location],
             )
-        ]
+        )
+        return ...
 
     @classmethod
     def _resolve_schema_type(
-        cls, field: FieldName, value: FieldValue, expected_type: Any
-    ) -> tuple[FieldValue | ellipsis, list[FieldValidationError]]:
+        cls,
+        field: FieldName,
+        value: FieldValue,
+        location: Location,
+        errors: list[FieldValidationError],
+        *,
+        expected_type: type[Schema],
+        validate_directly: bool,
+        message_prefix: str,
+    ) -> FieldValue | ellipsis:
         """
         Резолвер для вложенных схем (подклассов Schema).
 
         Логика:
-            - Если значение уже является экземпляром ожидаемой схемы — возвращается как есть.
             - Если значение является dict — выполняется попытка сконструировать
-              экземпляр expected_type(**dict).
-            - При возникновении ValidationError из дочерней схемы ошибки разворачиваются
-              в список FieldValidationError с добавлением текущего поля в location.
+              экземпляр expected_type(**dict). Обычный dict (самый частый случай)
+              распознается одним сравнением type(value) is dict, без isinstance.
+            - Если значение уже является экземпляром ожидаемой схемы — возвращается как есть.
+            - Если дочерняя схема не переопределяет __init__ (validate_directly), её функция валидации
+              вызывается напрямую: значения пишутся в __dict__ нового экземпляра, ошибки — сразу
+              в общий список с location текущего значения, без выброса и перехвата ValidationError.
+            - Иначе вызывается конструктор схемы, и при возникновении ValidationError её ошибки
+              переиспользуются: location текущего значения дописывается в начало location каждой ошибки,
+              после чего ошибки переносятся в общий список.
             - Если значение не соответствует ожидаемому формату, возвращается ошибка
 
-        :returns: Нормализованное значение для поля, список ошибок валидации
+        :returns: Нормализованное значение для поля
         """
 
-        if isinstance(value, expected_type):
-            return value, []
+        if type(value) is not dict:
+            if isinstance(value, expected_type):
+                return value
 
-        if isinstance(value, dict):
-            try:
-                return expected_type(**value), []
-            except ValidationError as exc:
-                return ..., [
+            if not isinstance(value, dict):
+                errors.append(
                     FieldValidationError(
-                        field=exc.field,
-                        message=exc.message,
-                        location=[field, *exc.location],
+                        field=field,
+                        message=message_prefix + type(value).__name__,
+                        location=[*location],
                     )
-                    for exc in exc.exceptions
-                ]
-
-        return ..., [
-            FieldValidationError(
-                field=field,
-                message=f"Ожидались dict или {expected_type.__name__}; передано {type(value).__name__}",
-                location=[field],
-            )
-        ]
+                )
+                return ...
+
+        if validate_directly:
+            instance = expected_type.__new__(expected_type)
+            errors_count = len(errors)
+            expected_type._get_validator()(value, instance.__dict__, errors, location)
+            return instance if len(errors) == errors_count else ...
+
+        try:
+            return expected_type(**value)
+        except ValidationError as exc:
+            for error in exc.exceptions:
+                error.location[:0] = location
+            errors.extend(exc.exceptions)
+            return ...
 
     @classmethod
     def _resolve_scalar_type(
-        cls, field: FieldName, value: FieldValue, expected_type: Any
-    ) -> tuple[FieldValue | ellipsis, list[FieldValidationError]]:
+        cls,
+        field: FieldName,
+        value: FieldValue,
+        location: Location,
+        errors: list[FieldValidationError],
+        *,
+        expected_type: type,
+        excluded_type: type | None,
+        message_prefix: str,
+    ) -> FieldValue | ellipsis:
         """
         Резолвер для скалярных и произвольных классовых типов.
 
         Логика:
             - Сюда попадает значение, если expected_type является классом
-              (int, str, float, bool или любой другой класс),
-              но isinstance(value, expected_type) вернул False.
-            - Формируется единичная ошибка FieldValidationError с указанием
-              ожидаемого и фактического типа.
-            - Всегда возвращается ellipsis вместо значения.
-
-        :returns: Нормализованное значение для поля, список ошибок валидации
+              (int, str, float, bool или любой другой класс).
+            - Если isinstance(value, expected_type) — значение возвращается как есть.
+            - Исключение — точный тип excluded_type (bool для int, см. _EXCLUDED_SUBCLASSES):
+              такие значения не принимаются, несмотря на наследование.
+            - Иначе формируется единичная ошибка FieldValidationError с указанием
+              ожидаемого и фактического типа, вместо значения возвращается ellipsis.
+
+        :returns: Нормализованное значение для поля
         """
 
-        return ..., [
+        if isinstance(value, expected_type) and type(value) is not excluded_type:
+            return value
+
+        errors.append(
             FieldValidationError(
                 field=field,
-                message=f"Ожидалось {expected_type.__name__}, передано {type(value).__name__}",
-                location=[field],
+                message=message_prefix + type(value).__name__,
+                location=[*location],
             )
-        ]
+        )
+        return ...
 
     @classmethod
     def _resolve_validators(
-        cls, field: FieldName, value: FieldValue, expected_type: Any
-    ) -> tuple[FieldValue | ellipsis, list[FieldValidationError]]:
+        cls,
+        field: FieldName,
+        value: FieldValue,
+        location: Location,
+        errors: list[FieldValidationError],
+        *,
+        base_resolver: Resolver,
+        validators: tuple[tuple[Callable[[FieldValue], FieldValue], str], ...],
+    ) -> FieldValue | ellipsis:
         """
-        Резолвер для кастомных валидаторов через Annotate
+        Резолвер для кастомных валидаторов через Annotate.
 
-        :returns: Нормализованное значение для поля, список ошибок валидации
+        Сначала значение проверяется резолвером базового типа base_resolver,
+        затем по очереди применяются валидаторы (каждый в паре с префиксом сообщения об ошибке).
+
+        :returns: Нормализованное значение для поля
         """
 
-        base_type, *validators = get_args(expected_type)
-        value, errors = cls._check_field_type(field, value, base_type)
+        errors_count = len(errors)
+        value = base_resolver(field, value, location, errors)
 
-        if errors:
-            return ..., errors
+        if len(errors) != errors_count:
+            return ...
 
-        validator_errors: list[FieldValidationError] = []
-        for validator in validators:
+        for validator, message_prefix in validators:
             try:
                 value = validator(value)
             except Exception as exc:
-                validator_errors.append(
+                errors.append(
                     FieldValidationError(
                         field=field,
-                        message=f"Ошибка валидатора {validator.__name__}: {exc}",
-                        location=[field],
+                        message=f"{message_prefix}{exc}",
+                        location=[*location],
                     )
                 )
 
-        if validator_errors:
-            return ..., validator_errors
+        if len(errors) != errors_count:
+            return ...
 
-        return value, []
+        return value
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import re
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@lru_cache(maxsize=512)
+def _compile(pattern: str, flags: int) -> re.Pattern[str]:
+    """
+    Кэширующая обертка над re.compile.
+
+    :returns: Скомпилированное регулярное выражение
+    """
+
+    return re.compile(pattern, flags)
+
+
+def regex(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """
+    Функция для получения скомпилированного регулярного выражения для использования в валидаторах.
+
+    Скомпилированные выражения кэшируются по (pattern, flags), поэтому функцию можно вызывать
+    прямо в теле валидатора: повторная компиляция выражения при каждой валидации не выполняется.
+
+    :returns: Скомпилированное регулярное выражение
+    """
+
+    return _compile(pattern, flags)
+
+
+@cache
+def _fuse_str_ops(operations: tuple[str, ...]) -> Callable[[str], str]:
+    """
+    Функция для генерации валидатора, применяющего цепочку строковых методов одним выражением.
+
+    :returns: Сгенерированный валидатор
+    """
+
+    source = f"def str_ops(value):\n    return value{''.join(f'.{operation}()' for operation in operations)}"
+    namespace: dict[str, Callable[[str], str]] = {}
+    exec(compile(source, "<str_ops>", "exec"), namespace)  # noqa: S102
+    return namespace["str_ops"]
+
+
+def str_ops(*, strip: bool = False, lower: bool = False, upper: bool = False) -> Callable[[str], str]:
+    """
+    Функция для получения валидатора, нормализующего строку встроенными методами str.
+
+    Вместо цепочки отдельных валидаторов (Annotated[str, v_strip, v_lower]) возвращается один
+    сгенерированный валидатор вида value.strip().lower(): при валидации выполняется один вызов
+    вместо вызова на каждое преобразование. Валидаторы кэшируются по набору преобразований.
+
+    :returns: Валидатор для использования в Annotated
+    :raise ValueError: Одновременно переданы lower и upper.
+    """
+
+    if lower and upper:
+        raise ValueError("Нельзя одновременно приводить строку к нижнему и верхнему регистру")
+
+    operations = (("strip", strip), ("lower", lower), ("upper", upper))
+    return _fuse_str_ops(tuple(operation for operation, enabled in operations if enabled))
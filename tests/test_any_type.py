@@ -0,0 +1,35 @@
+from typing import Any
+
+import pytest
+
+from sanitizer import Schema
+
+
+class TestAnyType:
+    """
+    Группа тестов на валидацию поля с типом Any
+    """
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            ...,
+            0,
+            "text",
+            3.14,
+            [1, "two"],
+            {"k": "v"},
+        ],
+    )
+    def test_success(self, value: Any) -> None:
+        """
+        Любое значение принимается и возвращается как есть
+        """
+
+        class S(Schema):
+            field: Any
+
+        s = S(field=value)
+
+        assert s.field is value, "check field value"
@@ -30,3 +30,22 @@ class TestDisallowedFields:
 
         for error in exc.value.exceptions:
             assert "Поле не предусмотрено схемой" in error.message, "Check error message"
+
+    def test_disallowed_instead_of_missing(self) -> None:
+        """
+        Лишнее поле вместо пропущенного: количество ключей совпадает с количеством полей схемы,
+        но обе ошибки должны быть найдены
+        """
+
+        class S(Schema):
+            a: int
+            b: int
+
+        with pytest.raises(ValidationError) as exc:
+            S.validate({"a": 1, "field": "sf"})
+
+        messages = sorted(error.message for error in exc.value.exceptions)
+        locations = sorted(error.location for error in exc.value.exceptions)
+
+        assert messages == ["Обязательное поле не передано", "Поле не предусмотрено схемой"]
+        assert locations == [["b"], ["field"]]
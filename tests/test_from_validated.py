@@ -0,0 +1,53 @@
+from sanitizer import Schema
+
+
+class TestFromValidated:
+    """
+    Группа тестов на создание схемы из уже провалидированных данных
+    """
+
+    def test_fields_assigned(self) -> None:
+        """
+        Поля переданного словаря проставляются в экземпляр схемы
+        """
+
+        class S(Schema):
+            a: int
+            b: list[str]
+
+        s = S.from_validated({"a": 1, "b": ["x"]})
+
+        assert isinstance(s, S)
+        assert s.a == 1
+        assert s.b == ["x"]
+
+    def test_validation_skipped(self) -> None:
+        """
+        Проверка типов не выполняется: метод рассчитан на доверенные данные
+        """
+
+        class S(Schema):
+            a: int
+
+        s = S.from_validated({"a": "not-an-int"})
+
+        assert s.a == "not-an-int"
+
+    def test_clone_instance(self) -> None:
+        """
+        Экземпляр схемы можно скопировать без повторной валидации вложенных схем
+        """
+
+        class Address(Schema):
+            city: str
+
+        class User(Schema):
+            id: int
+            address: Address
+
+        user = User(id=1, address={"city": "Moscow"})
+        clone = User.from_validated(vars(user))
+
+        assert clone is not user
+        assert clone.id == 1
+        assert clone.address is user.address
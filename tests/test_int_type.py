@@ -1,3 +1,5 @@
+from typing import Annotated
+
 import pytest
 
 from sanitizer import Schema, ValidationError
@@ -44,6 +46,8 @@ class TestIntType:
             [],
             [123, 23],
             (2, 3),
+            True,
+            False,
         ],
     )
     def test_invalid_type(self, value: int) -> None:
@@ -62,3 +66,23 @@ class TestIntType:
         assert len(exc.value.exceptions) == 1, "Check errors count"
         assert "Ожидалось int" in error.message, "Check error message"
         assert error.location == ["field"], "Check error location"
+
+    def test_annotated_rejects_bool(self) -> None:
+        """
+        bool не принимается и для поля int с валидаторами, валидаторы при этом не вызываются
+        """
+
+        def v_positive(value: int) -> int:
+            if value <= 0:
+                raise ValueError("должно быть > 0")
+            return value
+
+        class S(Schema):
+            field: Annotated[int, v_positive]
+
+        with pytest.raises(ValidationError) as exc:
+            S(field=True)
+
+        errors = exc.value.exceptions
+        assert len(errors) == 1, "Check errors count"
+        assert errors[0].message == "Ожидалось int, передано bool", "Check error message"
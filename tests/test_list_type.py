@@ -195,3 +195,67 @@ class TestListType:
 
         s = S(field=value)
         assert s.field == value
+
+    def test_valid_list_is_copied(self) -> None:
+        """
+        Полностью валидный список возвращается копией, а не исходным объектом.
+        """
+
+        class S(Schema):
+            field: list[int]
+
+        value = [1, 2, 3]
+        s = S(field=value)
+
+        assert s.field == value
+        assert s.field is not value
+
+    def test_list_of_schema_instances(self) -> None:
+        """
+        Список уже созданных экземпляров схемы принимается без повторной валидации элементов.
+        """
+
+        class Item(Schema):
+            sku: str
+
+        class Order(Schema):
+            items: list[Item]
+
+        items = [Item(sku="A1"), Item(sku="B2")]
+        order = Order(items=items)
+
+        assert order.items == items
+        assert all(a is b for a, b in zip(order.items, items, strict=True))
+
+    def test_list_of_subclass_instances(self) -> None:
+        """
+        Элементы-подклассы типа элементов списка проходят поэлементную проверку и принимаются.
+        """
+
+        class Name(str):
+            pass
+
+        class S(Schema):
+            field: list[str]
+
+        value = ["a", Name("b")]
+        s = S(field=value)
+
+        assert s.field == value
+        assert isinstance(s.field[1], Name)
+
+    def test_list_of_int_rejects_bool(self) -> None:
+        """
+        bool не принимается в качестве элемента list[int], несмотря на наследование от int.
+        """
+
+        class S(Schema):
+            field: list[int]
+
+        with pytest.raises(ValidationError) as exc:
+            S(field=[1, True, 3])
+
+        errors = exc.value.exceptions
+        assert len(errors) == 1, "Должна быть одна ошибка"
+        assert errors[0].message == "Ожидалось int, передано bool"
+        assert errors[0].location == ["field", 1]
@@ -0,0 +1,180 @@
+import pytest
+
+from sanitizer import Schema, ValidationError
+
+
+class TestMaxErrors:
+    """
+    Группа тестов на ограничение количества собираемых ошибок валидации
+    """
+
+    def test_unbounded_by_default(self) -> None:
+        """
+        По умолчанию собираются все ошибки
+        """
+
+        class S(Schema):
+            field: list[int]
+
+        with pytest.raises(ValidationError) as exc_info:
+            S.validate({"field": ["a"] * 10})
+
+        assert len(exc_info.value.exceptions) == 10
+
+    def test_stops_at_limit(self) -> None:
+        """
+        Валидация прерывается на max_errors ошибках, location ошибок сохраняется
+        """
+
+        class S(Schema):
+            field: list[int]
+            other: str
+
+        with pytest.raises(ValidationError) as exc_info:
+            S.validate({"field": ["a"] * 10, "other": 1}, max_errors=3)
+
+        errors = exc_info.value.exceptions
+        assert [err.location for err in errors] == [["field", 0], ["field", 1], ["field", 2]]
+
+    def test_nested_schema(self) -> None:
+        """
+        Лимит учитывает ошибки вложенных схем
+        """
+
+        class Item(Schema):
+            a: int
+            b: int
+
+        class S(Schema):
+            items: list[Item]
+
+        with pytest.raises(ValidationError) as exc_info:
+            S.validate({"items": [{"a": "x", "b": "y"}, {"a": "z", "b": "w"}]}, max_errors=3)
+
+        errors = exc_info.value.exceptions
+        assert [err.location for err in errors] == [["items", 0, "a"], ["items", 0, "b"], ["items", 1, "a"]]
+
+    def test_custom_init_truncated(self) -> None:
+        """
+        Для схемы с переопределенным __init__ список ошибок обрезается до max_errors
+        """
+
+        class S(Schema):
+            a: int
+            b: int
+            c: int
+
+            def __init__(self, **fields: object) -> None:
+                super().__init__(**fields)
+
+        with pytest.raises(ValidationError) as exc_info:
+            S.validate({"a": "x", "b": "y", "c": "z"}, max_errors=2)
+
+        assert [err.field for err in exc_info.value.exceptions] == ["a", "b"]
+
+    def test_valid_data(self) -> None:
+        """
+        Валидные данные возвращают экземпляр схемы при заданном лимите
+        """
+
+        class S(Schema):
+            field: list[int]
+
+        s = S.validate({"field": [1, 2]}, max_errors=1)
+
+        assert isinstance(s, S)
+        assert s.field == [1, 2]
+
+    def test_invalid_limit(self) -> None:
+        """
+        Лимит меньше 1 не допускается
+        """
+
+        class S(Schema):
+            field: int
+
+        with pytest.raises(ValueError, match="max_errors"):
+            S.validate({"field": 1}, max_errors=0)
+
+    @pytest.mark.parametrize("max_errors", [1.5, True, "3"])
+    def test_non_int_limit(self, max_errors: object) -> None:
+        """
+        Лимит должен быть int: float, bool и другие типы не допускаются
+        """
+
+        class S(Schema):
+            field: int
+
+        with pytest.raises(TypeError, match="max_errors"):
+            S.validate({"field": 1}, max_errors=max_errors)
+
+    @pytest.mark.parametrize("max_errors", [None, 5])
+    def test_self_key(self, max_errors: int | None) -> None:
+        """
+        Ключ self отклоняется одинаково с лимитом и без него
+        """
+
+        class S(Schema):
+            a: int
+
+        with pytest.raises(TypeError, match="self"):
+            S.validate({"self": 1, "a": 1}, max_errors=max_errors)
+
+    @pytest.mark.parametrize("max_errors", [None, 5])
+    def test_non_str_keys(self, max_errors: int | None) -> None:
+        """
+        Ключи, не являющиеся строками, отклоняются одинаково с лимитом и без него
+        """
+
+        class S(Schema):
+            a: int
+
+        with pytest.raises(TypeError, match="keywords must be strings"):
+            S.validate({1: 2, "a": 1}, max_errors=max_errors)
+
+    @pytest.mark.parametrize("max_errors", [None, 5])
+    @pytest.mark.parametrize("custom_init", [False, True])
+    @pytest.mark.parametrize(
+        ("fields", "match"),
+        [
+            ({"child": {1: 2, "x": 1}}, "keywords must be strings"),
+            ({"children": [{1: 2, "x": 1}]}, "keywords must be strings"),
+            ({"child": {"self": 1, "x": 1}}, "self"),
+            ({"children": [{"self": 1, "x": 1}]}, "self"),
+        ],
+    )
+    def test_nested_non_str_keys(
+        self, max_errors: int | None, custom_init: bool, fields: dict[str, object], match: str
+    ) -> None:
+        """
+        Ключи вложенных схем отклоняются так же, как при вызове конструктора схемы,
+        независимо от лимита и от того, переопределен ли __init__ вложенной схемы
+        """
+
+        class Child(Schema):
+            x: int
+
+        if custom_init:
+
+            def __init__(self: Child, **fields: object) -> None:
+                super(Child, self).__init__(**fields)
+
+            Child.__init__ = __init__
+
+        class S(Schema):
+            child: Child
+            children: list[Child]
+
+        data = {"child": {"x": 1}, "children": [], **fields}
+        with pytest.raises(TypeError, match=match):
+            S.validate(data, max_errors=max_errors)
+
+    def test_field_named_max_errors(self) -> None:
+        """
+        Поле с именем max_errors не конфликтует с параметром лимита
+        """
+
+        class S(Schema):
+            max_errors: int
+
+        assert S.validate({"max_errors": 1}, max_errors=1).max_errors == 1
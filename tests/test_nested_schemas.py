@@ -117,3 +117,28 @@ class TestNestedSchemas:
         error = exc.value.exceptions[0]
         assert "Ожидался список" in error.message
         assert error.location == ["items"]
+
+    def test_nested_schema_custom_init(self) -> None:
+        """
+        Если вложенная схема переопределяет __init__, он вызывается при валидации вложенного dict.
+        """
+
+        class Address(Schema):
+            city: str
+
+            def __init__(self, **fields: str) -> None:
+                super().__init__(**fields)
+                self.city = self.city.upper()
+
+        class User(Schema):
+            address: Address
+
+        user = User(address={"city": "Moscow"})
+        assert user.address.city == "MOSCOW"
+
+        with pytest.raises(ValidationError) as exc:
+            User(address={"city": 1})
+
+        error = exc.value.exceptions[0]
+        assert "Ожидалось str" in error.message
+        assert error.location == ["address", "city"]
@@ -0,0 +1,37 @@
+import re
+
+from sanitizer import regex
+
+
+class TestRegex:
+    """
+    Группа тестов на хелпер для компиляции регулярных выражений
+    """
+
+    def test_returns_compiled_pattern(self) -> None:
+        """
+        Возвращается скомпилированное регулярное выражение
+        """
+
+        pattern = regex(r"\d+")
+
+        assert isinstance(pattern, re.Pattern)
+        assert pattern.sub("", "a1b22c") == "abc"
+
+    def test_cached(self) -> None:
+        """
+        Повторный вызов с теми же аргументами возвращает тот же объект
+        """
+
+        assert regex(r"\w+") is regex(r"\w+")
+
+    def test_flags_are_part_of_key(self) -> None:
+        """
+        Флаги учитываются при кэшировании
+        """
+
+        pattern = regex(r"abc", re.IGNORECASE)
+
+        assert pattern is not regex(r"abc")
+        assert pattern.flags & re.IGNORECASE
+        assert pattern.fullmatch("ABC")
@@ -0,0 +1,62 @@
+from typing import Annotated, Any
+
+from sanitizer import Schema
+
+
+class TestResolverOverrides:
+    """
+    Группа тестов на переопределение резолверов в подклассах Schema:
+    переопределенный резолвер вызывается и для полей верхнего уровня, и для элементов списков
+    """
+
+    def test_scalar_override(self) -> None:
+        """
+        Переопределенный _resolve_scalar_type используется для обычных полей, Annotated и элементов списка
+        """
+
+        class Base(Schema):
+            @classmethod
+            def _resolve_scalar_type(cls, field: str, value: Any, location: list, errors: list, **kwargs: Any) -> Any:
+                return "OVERRIDE"
+
+        class S(Base):
+            x: int
+            y: list[str]
+            z: Annotated[str, str.upper]
+
+        s = S(x=1, y=["q"], z="a")
+
+        assert s.x == "OVERRIDE"
+        assert s.y == ["OVERRIDE"]
+        assert s.z == "OVERRIDE"
+
+    def test_any_override(self) -> None:
+        """
+        Переопределенный _resolve_any_type используется для полей Any
+        """
+
+        class S(Schema):
+            field: Any
+
+            @classmethod
+            def _resolve_any_type(cls, field: str, value: Any, location: list, errors: list) -> Any:
+                return "OVERRIDE"
+
+        assert S(field=1).field == "OVERRIDE"
+
+    def test_schema_override_in_list(self) -> None:
+        """
+        Переопределенный _resolve_schema_type используется для элементов list[Schema]
+        """
+
+        class Item(Schema):
+            a: int
+
+        class S(Schema):
+            items: list[Item]
+
+            @classmethod
+            def _resolve_schema_type(cls, field: str, value: Any, location: list, errors: list, **kwargs: Any) -> Any:
+                return "OVERRIDE"
+
+        assert S(items=[{"a": 1}, Item(a=2)]).items == ["OVERRIDE", "OVERRIDE"]
@@ -0,0 +1,104 @@
+from unittest import mock
+
+from sanitizer import Schema
+from sanitizer import schema as schema_module
+
+
+class Node(Schema):
+    value: int
+    children: list["Node"]
+
+
+class TestSchemaCaching:
+    """
+    Группа тестов на кэширование служебных данных схемы между валидациями
+    """
+
+    def test_type_hints_resolved_once(self) -> None:
+        """
+        type hints схемы вычисляются один раз и переиспользуются при повторных валидациях
+        """
+
+        class S(Schema):
+            field: int
+
+        with mock.patch.object(schema_module, "get_type_hints", wraps=schema_module.get_type_hints) as spy:
+            S(field=1)
+            S(field=2)
+            S.validate({"field": 3})
+
+        assert spy.call_count == 1, "get_type_hints должен вызываться один раз на класс"
+
+    def test_type_hints_not_shared_with_subclass(self) -> None:
+        """
+        Кэш type hints родительской схемы не наследуется подклассами
+        """
+
+        class Parent(Schema):
+            a: int
+
+        class Child(Parent):
+            b: str
+
+        Parent(a=1)
+        child = Child(a=1, b="b")
+
+        assert child.a == 1
+        assert child.b == "b"
+
+    def test_forward_reference(self) -> None:
+        """
+        Аннотации разрешаются при первой валидации, а не при объявлении класса
+        """
+
+        node = Node(value=1, children=[{"value": 2, "children": []}])
+
+        assert isinstance(node.children[0], Node)
+
+    def test_field_plan_built_once(self) -> None:
+        """
+        План резолверов полей строится один раз на класс
+        """
+
+        class S(Schema):
+            field: list[int]
+
+        with mock.patch.object(S, "_build_resolver", wraps=S._build_resolver) as spy:
+            S(field=[1, 2])
+            S(field=[3])
+
+        assert spy.call_count == 2, "Резолверы list[int] и int подбираются только при построении плана"
+
+    def test_validator_compiled_once(self) -> None:
+        """
+        Функция валидации схемы генерируется один раз на класс
+        """
+
+        class S(Schema):
+            a: int
+            b: list[str]
+
+        with mock.patch.object(S, "_compile_validator", wraps=S._compile_validator) as spy:
+            S(a=1, b=["b"])
+            S(a=2, b=[])
+
+        assert spy.call_count == 1, "Функция валидации должна генерироваться один раз на класс"
+
+    def test_nothing_built_on_class_definition(self) -> None:
+        """
+        Объявление схемы не разрешает type hints и не строит план: все откладывается до первой валидации
+        """
+
+        with mock.patch.object(schema_module, "get_type_hints", wraps=schema_module.get_type_hints) as spy:
+
+            class S(Schema):
+                field: int
+
+        assert spy.call_count == 0, "get_type_hints не должен вызываться при объявлении схемы"
+        assert "_type_hints" not in S.__dict__
+        assert "_field_plan" not in S.__dict__
+        assert "_validator" not in S.__dict__
+
+        S(field=1)
+
+        assert "_validator" in S.__dict__
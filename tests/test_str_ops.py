@@ -0,0 +1,67 @@
+from typing import Annotated
+
+import pytest
+
+from sanitizer import Schema, ValidationError, str_ops
+
+
+class TestStrOps:
+    """
+    Группа тестов на валидатор нормализации строк встроенными методами str
+    """
+
+    @pytest.mark.parametrize(
+        ("options", "value", "expected"),
+        [
+            ({"strip": True}, "  Hello ", "Hello"),
+            ({"lower": True}, "HeLLo", "hello"),
+            ({"upper": True}, "HeLLo", "HELLO"),
+            ({"strip": True, "lower": True}, "  HeLLo ", "hello"),
+            ({}, " HeLLo ", " HeLLo "),
+        ],
+    )
+    def test_operations(self, options: dict[str, bool], value: str, expected: str) -> None:
+        """
+        Преобразования применяются к строке одним вызовом валидатора
+        """
+
+        assert str_ops(**options)(value) == expected
+
+    def test_in_schema(self) -> None:
+        """
+        Валидатор используется в Annotated наравне с пользовательскими валидаторами
+        """
+
+        class S(Schema):
+            field: Annotated[str, str_ops(strip=True, lower=True)]
+
+        assert S(field="  HeLLo ").field == "hello"
+
+    def test_base_type_checked_first(self) -> None:
+        """
+        Базовый тип поля проверяется до вызова валидатора
+        """
+
+        class S(Schema):
+            field: Annotated[str, str_ops(strip=True)]
+
+        with pytest.raises(ValidationError) as exc_info:
+            S(field=1)
+
+        err = exc_info.value.exceptions[0]
+        assert err.message == "Ожидалось str, передано int"
+
+    def test_cached(self) -> None:
+        """
+        Повторный вызов с тем же набором преобразований возвращает тот же валидатор
+        """
+
+        assert str_ops(strip=True, lower=True) is str_ops(lower=True, strip=True)
+
+    def test_lower_and_upper(self) -> None:
+        """
+        Одновременное приведение к нижнему и верхнему регистру запрещено
+        """
+
+        with pytest.raises(ValueError, match="регистру"):
+            str_ops(lower=True, upper=True)
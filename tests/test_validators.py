@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Annotated, Any
 
 import pytest
@@ -57,6 +58,20 @@ def v_even(x: int) -> int:
     return x
 
 
+class NotEqual:
+    """
+    Валидатор-экземпляр класса с __call__: запрещает переданное значение
+    """
+
+    def __init__(self, forbidden: Any) -> None:
+        self.forbidden = forbidden
+
+    def __call__(self, x: Any) -> Any:
+        if x == self.forbidden:
+            raise ValueError("запрещённое значение")
+        return x
+
+
 class TestAnnotatedScalar:
     """
     Тесты валидаторов для скалярных полей через Annotated[T, validator...].
@@ -187,3 +202,62 @@ class TestAnnotatedLists:
         err = exc.value.exceptions[0]
         assert "Ожидался список" in err.message
         assert err.location == ["field"]
+
+
+class TestCallableValidators:
+    """
+    Валидаторы без __name__ (functools.partial, экземпляры классов с __call__).
+    В сообщении об ошибке вместо имени функции используется имя класса валидатора.
+    """
+
+    def test_scalar_partial_success(self) -> None:
+        """
+        functools.partial в качестве валидатора скалярного поля.
+        """
+
+        class S(Schema):
+            field: Annotated[str, partial(str.strip)]
+
+        assert S(field="  x ").field == "x"
+
+    def test_scalar_callable_instance_error(self) -> None:
+        """
+        Ошибка валидатора-экземпляра скалярного поля: в сообщении имя его класса.
+        """
+
+        class S(Schema):
+            field: Annotated[int, NotEqual(0)]
+
+        assert S(field=1).field == 1
+
+        with pytest.raises(ValidationError) as exc:
+            S(field=0)
+
+        err = exc.value.exceptions[0]
+        assert err.message == "Ошибка валидатора NotEqual: запрещённое значение"
+        assert err.location == ["field"]
+
+    def test_list_item_partial_success(self) -> None:
+        """
+        functools.partial в качестве валидатора элементов списка.
+        """
+
+        class S(Schema):
+            field: list[Annotated[str, partial(str.strip)]]
+
+        assert S(field=["  x ", "y "]).field == ["x", "y"]
+
+    def test_list_item_callable_instance_error(self) -> None:
+        """
+        Ошибка валидатора-экземпляра элемента списка: в сообщении имя его класса, location с индексом.
+        """
+
+        class S(Schema):
+            field: list[Annotated[int, NotEqual(0)]]
+
+        with pytest.raises(ValidationError) as exc:
+            S(field=[1, 0])
+
+        err = exc.value.exceptions[0]
+        assert err.message == "Ошибка валидатора NotEqual: запрещённое значение"
+        assert err.location == ["field", 1]
@@ -2,35 +2,57 @@
 Пример создания и использования кастомных валидаторов.
 """
 
-import re
 from typing import Annotated
 
-from sanitizer import Schema
+from sanitizer import Schema, regex
 
-RUSSIAN_PHONE_CLEANER = re.compile(r"\D+")
+# Таблица для str.translate: ASCII-цифры остаются, остальные ASCII-символы удаляются.
+# Символы вне ASCII дают IndexError (LookupError), и str.translate оставляет их без изменений.
+ASCII_DIGITS_TABLE = tuple(chr(code) if chr(code).isdigit() else None for code in range(128))
+
+# Допустимая первая цифра номера -> код страны, на который она заменяется
+PHONE_COUNTRY_CODES = {"8": "7", "7": "7"}
+
+
+def extract_digits(value: str) -> str:
+    """
+    Оставляет в строке только десятичные цифры, так же как удаление по регулярному выражению \\D+.
+    Для ASCII-строк это один проход str.translate без движка регулярных выражений.
+    """
+
+    digits = value.translate(ASCII_DIGITS_TABLE)
+    if not digits.isascii():
+        digits = "".join(filter(str.isdecimal, digits))
+    return digits
 
 
 def russian_phone_validator(value: str) -> str:
     if not isinstance(value, str):
         raise ValueError("Номер телефона должен быть строкой")
 
-    digits = RUSSIAN_PHONE_CLEANER.sub("", value)
+    digits = extract_digits(value)
 
-    if digits.startswith("8"):
-        digits = "7" + digits[1:]
-    elif digits.startswith("7"):
-        pass
-    elif digits.startswith("+7"):
-        digits = digits[1:]
-    else:
+    # После extract_digits символа "+" в строке нет: номер "+7..." начинается с "7"
+    country_code = PHONE_COUNTRY_CODES.get(digits[:1])
+    if country_code is None:
         raise ValueError("Номер должен начинаться с 8 или +7")
 
-    if len(digits) != 11 or not digits.isdigit():
+    digits = country_code + digits[1:]
+
+    # extract_digits оставляет только десятичные цифры, поэтому достаточно проверить длину
+    if len(digits) != 11:
         raise ValueError("Номер телефона должен содержать 11 цифр")
 
     return digits
 
 
+def email_validator(value: str) -> str:
+    # regex() кэширует скомпилированное выражение, поэтому его можно вызывать прямо в теле валидатора
+    if regex(r"[^@\s]+@[^@\s]+\.[^@\s]+").fullmatch(value) is None:
+        raise ValueError("Некорректный адрес электронной почты")
+    return value.lower()
+
+
 def min_age_validator(age: int) -> int:
     if age < 10:
         raise ValueError("age must be at least 10")
@@ -41,6 +63,7 @@ class Person(Schema):
     name: str
     age: Annotated[int, min_age_validator]
     phone: Annotated[str, russian_phone_validator]
+    email: Annotated[str, email_validator]
 
 
 person = Person.validate(
@@ -48,9 +71,11 @@ person = Person.validate(
         "name": "Ruslan",
         "age": 23,
         "phone": "8 (950) 288-56-23",
+        "email": "Ruslan@Example.com",
     }
 )
 
 print(person.name)  # noqa
 print(person.age) # noqa
-print(person.phone) # noqa
\ No newline at end of file
+print(person.phone) # noqa
+print(person.email) # noqa
\ No newline at end of file